@@ -5,7 +5,9 @@ A deterministic workflow system that guides AI assistants through
 structured development stages: PM -> DESIGN -> DEV -> TEST -> QA -> REVIEW -> DOCS.
 """
 
+from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from galangal.exceptions import (
     AIError,
@@ -16,14 +18,29 @@ from galangal.exceptions import (
     ValidationError,
     WorkflowError,
 )
-from galangal.logging import (
-    WorkflowLogger,
-    configure_logging,
-    get_logger,
-    workflow_logger,
+
+if TYPE_CHECKING:
+    from galangal.logging import (
+        WorkflowLogger,
+        configure_logging,
+        get_logger,
+        workflow_logger,
+    )
+
+# Logging pulls in structlog, so it is imported on first access rather than
+# on every CLI invocation
+_LOGGING_EXPORTS = frozenset(
+    {"WorkflowLogger", "configure_logging", "get_logger", "workflow_logger"}
 )
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve the logging re-exports lazily (PEP 562)."""
+    if name in _LOGGING_EXPORTS:
+        return getattr(import_module("galangal.logging"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _read_version() -> str:
     """Read version from VERSION file."""
     # Try various locations (installed vs development)
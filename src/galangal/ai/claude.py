@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+import textwrap
 from typing import TYPE_CHECKING, Any
 
 from galangal.ai.base import AIBackend, PauseCheck
@@ -20,6 +21,11 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Tool names grouped by how their activity is displayed in the TUI
+_FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+_SEARCH_TOOLS = frozenset({"Grep", "Glob"})
+_SILENT_TOOLS = frozenset({"TodoWrite"})
+
 
 class ClaudeBackend(AIBackend):
     """Claude CLI backend."""
@@ -236,7 +242,7 @@ class ClaudeBackend(AIBackend):
                     pending_tools.append((tool_id, tool_name))
 
                 if ui:
-                    if tool_name in ["Write", "Edit"]:
+                    if tool_name in _FILE_WRITE_TOOLS:
                         tool_input = item.get("input", {})
                         file_path = tool_input.get("file_path", "") or tool_input.get("path", "")
                         if file_path:
@@ -257,7 +263,7 @@ class ClaudeBackend(AIBackend):
                         ui.add_activity(f"Bash: {cmd_preview}", "🔧", verbose_only=True)
                         ui.set_status("running", "bash")
 
-                    elif tool_name in ["Grep", "Glob"]:
+                    elif tool_name in _SEARCH_TOOLS:
                         pattern = item.get("input", {}).get("pattern", "")[:80]
                         ui.add_activity(f"{tool_name}: {pattern}", "🔍", verbose_only=True)
                         ui.set_status("searching", pattern[:40])
@@ -267,7 +273,7 @@ class ClaudeBackend(AIBackend):
                         ui.add_activity(f"Task: {desc}", "🤖", verbose_only=True)
                         ui.set_status("agent", desc[:25])
 
-                    elif tool_name not in ["TodoWrite"]:
+                    elif tool_name not in _SILENT_TOOLS:
                         ui.add_activity(f"{tool_name}", "⚡", verbose_only=True)
                         ui.set_status("executing", tool_name)
 
@@ -276,7 +282,6 @@ class ClaudeBackend(AIBackend):
                 text = item.get("text", "").strip()
                 if text and ui:
                     # Wrap long lines to avoid horizontal scrolling
-                    import textwrap
                     wrapped_lines = []
                     for line in text.split("\n"):
                         if len(line) > 100:
@@ -6,7 +6,7 @@ import argparse
 
 from rich.prompt import Prompt
 
-from galangal.core.state import STAGE_ORDER, parse_stage_arg, save_state
+from galangal.core.state import STAGE_INDEX, parse_stage_arg, save_state
 from galangal.core.tasks import ensure_active_task_with_state
 from galangal.core.workflow import run_workflow
 from galangal.ui.console import console, print_info, print_success
@@ -24,8 +24,8 @@ def cmd_skip_to(args: argparse.Namespace) -> int:
         return 1
 
     current_stage = state.stage
-    current_idx = STAGE_ORDER.index(current_stage) if current_stage in STAGE_ORDER else -1
-    target_idx = STAGE_ORDER.index(target_stage)
+    current_idx = STAGE_INDEX.get(current_stage, -1)
+    target_idx = STAGE_INDEX[target_stage]
 
     # Warn if skipping backwards or forwards
     if target_idx < current_idx:
@@ -3,7 +3,8 @@ galangal start - Start a new task.
 """
 
 import argparse
-import threading
+import asyncio
+from dataclasses import dataclass
 
 from galangal.core.state import (
     TaskType,
@@ -27,6 +28,20 @@ from galangal.core.workflow import run_workflow
 from galangal.ui.tui import PromptType, WorkflowTUIApp
 
 
+@dataclass
+class _TaskSetup:
+    """Task details collected by the setup flow, shared with the creation worker."""
+
+    description: str = ""
+    name: str = ""
+    type: TaskType | None = None
+    github_issue: int | None = None
+    github_repo: str | None = None
+    issue_body: str | None = None
+    screenshots: list[str] | None = None
+    exit_code: int = 0
+
+
 def _check_config_updates() -> bool:
     """Check for missing config sections and prompt user.
 
@@ -157,22 +172,14 @@ def cmd_start(args: argparse.Namespace) -> int:
     # Create TUI app for task setup
     app = WorkflowTUIApp("New Task", "SETUP", hidden_stages=frozenset())
 
-    task_info = {
-        "type": None,
-        "description": description,
-        "name": task_name,
-        "github_issue": from_issue,
-        "github_repo": None,
-        "screenshots": None,
-    }
-    result_code = {"value": 0}
-
-    def task_creation_thread():
+    setup = _TaskSetup(description=description, name=task_name, github_issue=from_issue)
+
+    async def task_creation_loop() -> None:
         try:
             app.add_activity("[bold]Starting new task...[/bold]", "🆕")
 
             # Check if on base branch before starting
-            on_base, current_branch, base_branch = is_on_base_branch()
+            on_base, current_branch, base_branch = await asyncio.to_thread(is_on_base_branch)
             if not on_base:
                 app.set_status("setup", "checking branch")
                 app.add_activity(
@@ -180,27 +187,18 @@ def cmd_start(args: argparse.Namespace) -> int:
                     "⚠️",
                 )
 
-                branch_event = threading.Event()
-                branch_result = {"value": None}
-
-                def handle_branch_choice(choice):
-                    branch_result["value"] = choice
-                    branch_event.set()
-
-                app.show_prompt(
+                branch_choice = await app.prompt_async(
                     PromptType.YES_NO,
                     f"Switch to '{base_branch}' branch before creating task?",
-                    handle_branch_choice,
                 )
-                branch_event.wait()
 
-                if branch_result["value"] == "yes":
-                    success, message = switch_to_base_branch()
+                if branch_choice == "yes":
+                    success, message = await asyncio.to_thread(switch_to_base_branch)
                     if success:
                         app.add_activity(f"Switched to '{base_branch}' branch", "✓")
                         # Pull latest changes after switching
                         app.set_status("setup", "pulling latest")
-                        pull_success, pull_msg = pull_base_branch()
+                        pull_success, pull_msg = await asyncio.to_thread(pull_base_branch)
                         if pull_success:
                             app.add_activity(f"Pulled latest from '{base_branch}'", "✓")
                         else:
@@ -214,8 +212,8 @@ def cmd_start(args: argparse.Namespace) -> int:
                             "error",
                         )
                         app._workflow_result = "error"
-                        result_code["value"] = 1
-                        app.call_from_thread(app.set_timer, 0.5, app.exit)
+                        setup.exit_code = 1
+                        app.set_timer(0.5, app.exit)
                         return
                 else:
                     # User chose not to switch - continue on current branch
@@ -226,7 +224,7 @@ def cmd_start(args: argparse.Namespace) -> int:
             else:
                 # Already on base branch - pull latest changes
                 app.set_status("setup", "pulling latest")
-                pull_success, pull_msg = pull_base_branch()
+                pull_success, pull_msg = await asyncio.to_thread(pull_base_branch)
                 if pull_success:
                     app.add_activity(f"Pulled latest from '{base_branch}'", "✓")
                 else:
@@ -235,30 +233,18 @@ def cmd_start(args: argparse.Namespace) -> int:
                     app.show_message(f"Warning: {pull_msg}", "warning")
 
             # Step 0: Choose task source (manual or GitHub) if no description/issue provided
-            if not task_info["description"] and not task_info["github_issue"]:
+            if not setup.description and not setup.github_issue:
                 app.set_status("setup", "select task source")
 
-                source_event = threading.Event()
-                source_result = {"value": None}
-
-                def handle_source(choice):
-                    source_result["value"] = choice
-                    source_event.set()
+                source_choice = await app.prompt_async(PromptType.TASK_SOURCE, "Create task from:")
 
-                app.show_prompt(
-                    PromptType.TASK_SOURCE,
-                    "Create task from:",
-                    handle_source,
-                )
-                source_event.wait()
-
-                if source_result["value"] == "quit":
+                if source_choice == "quit":
                     app._workflow_result = "cancelled"
-                    result_code["value"] = 1
-                    app.call_from_thread(app.set_timer, 0.5, app.exit)
+                    setup.exit_code = 1
+                    app.set_timer(0.5, app.exit)
                     return
 
-                if source_result["value"] == "github":
+                if source_choice == "github":
                     # Handle GitHub issue selection
                     app.set_status("setup", "checking GitHub")
                     app.show_message("Checking GitHub setup...", "info")
@@ -267,58 +253,46 @@ def cmd_start(args: argparse.Namespace) -> int:
                         from galangal.github.client import ensure_github_ready
                         from galangal.github.issues import list_issues
 
-                        check = ensure_github_ready()
+                        check = await asyncio.to_thread(ensure_github_ready)
                         if not check:
                             app.show_message(
                                 "GitHub not ready. Run 'galangal github check'", "error"
                             )
                             app._workflow_result = "error"
-                            result_code["value"] = 1
-                            app.call_from_thread(app.set_timer, 0.5, app.exit)
+                            setup.exit_code = 1
+                            app.set_timer(0.5, app.exit)
                             return
 
-                        task_info["github_repo"] = check.repo_name
+                        setup.github_repo = check.repo_name
 
                         # List issues with galangal label
                         app.set_status("setup", "fetching issues")
                         app.show_message("Fetching issues...", "info")
 
-                        issues = list_issues()
+                        issues = await asyncio.to_thread(list_issues)
                         if not issues:
                             app.show_message("No issues with 'galangal' label found", "warning")
                             app._workflow_result = "cancelled"
-                            result_code["value"] = 1
-                            app.call_from_thread(app.set_timer, 0.5, app.exit)
+                            setup.exit_code = 1
+                            app.set_timer(0.5, app.exit)
                             return
 
                         # Show issue selection
                         app.set_status("setup", "select issue")
-                        issue_event = threading.Event()
-                        issue_result = {"value": None}
-
-                        def handle_issue(issue_num):
-                            issue_result["value"] = issue_num
-                            issue_event.set()
-
                         issue_options = [(i.number, i.title) for i in issues]
-                        app.show_github_issue_select(issue_options, handle_issue)
-                        issue_event.wait()
+                        issue_num = await app.select_github_issue_async(issue_options)
 
-                        if issue_result["value"] is None:
+                        if issue_num is None:
                             app._workflow_result = "cancelled"
-                            result_code["value"] = 1
-                            app.call_from_thread(app.set_timer, 0.5, app.exit)
+                            setup.exit_code = 1
+                            app.set_timer(0.5, app.exit)
                             return
 
                         # Get the selected issue details
-                        selected_issue = next(
-                            (i for i in issues if i.number == issue_result["value"]), None
-                        )
+                        selected_issue = next((i for i in issues if i.number == issue_num), None)
                         if selected_issue:
-                            task_info["github_issue"] = selected_issue.number
-                            task_info["description"] = (
-                                f"{selected_issue.title}\n\n{selected_issue.body}"
-                            )
+                            setup.github_issue = selected_issue.number
+                            setup.description = f"{selected_issue.title}\n\n{selected_issue.body}"
                             app.show_message(f"Selected issue #{selected_issue.number}", "success")
 
                             # Download screenshots from issue body
@@ -332,14 +306,14 @@ def cmd_start(args: argparse.Namespace) -> int:
                                 )
                                 # Note: Actual download happens after task_name is generated
                                 # Store the issue body for later processing
-                                task_info["_issue_body"] = selected_issue.body
+                                setup.issue_body = selected_issue.body
 
                             # Try to infer task type from labels
                             type_hint = selected_issue.get_task_type_hint()
                             if type_hint:
-                                task_info["type"] = TaskType.from_str(type_hint)
+                                setup.type = TaskType.from_str(type_hint)
                                 app.show_message(
-                                    f"Inferred type from labels: {task_info['type'].display_name()}",
+                                    f"Inferred type from labels: {setup.type.display_name()}",
                                     "info",
                                 )
 
@@ -347,111 +321,98 @@ def cmd_start(args: argparse.Namespace) -> int:
                         debug_exception("GitHub integration failed", e)
                         app.show_message(f"GitHub error: {e}", "error")
                         app._workflow_result = "error"
-                        result_code["value"] = 1
-                        app.call_from_thread(app.set_timer, 0.5, app.exit)
+                        setup.exit_code = 1
+                        app.set_timer(0.5, app.exit)
                         return
 
             # Step 1: Get task type (if not already set from GitHub labels)
-            if task_info["type"] is None:
+            if setup.type is None:
                 app.set_status("setup", "select task type")
 
-                type_event = threading.Event()
-                type_result = {"value": None}
-
-                def handle_type(choice):
-                    type_result["value"] = choice
-                    type_event.set()
-
-                app.show_prompt(
-                    PromptType.TASK_TYPE,
-                    "Select task type:",
-                    handle_type,
-                )
-                type_event.wait()
+                type_choice = await app.prompt_async(PromptType.TASK_TYPE, "Select task type:")
 
-                if type_result["value"] == "quit":
+                if type_choice == "quit":
                     app._workflow_result = "cancelled"
-                    result_code["value"] = 1
-                    app.call_from_thread(app.set_timer, 0.5, app.exit)
+                    setup.exit_code = 1
+                    app.set_timer(0.5, app.exit)
                     return
 
                 # Map selection to TaskType
-                task_info["type"] = TaskType.from_str(type_result["value"])
+                setup.type = TaskType.from_str(type_choice)
 
-            app.show_message(f"Task type: {task_info['type'].display_name()}", "success")
+            app.show_message(f"Task type: {setup.type.display_name()}", "success")
 
             # Step 2: Get task description if not provided
-            if not task_info["description"]:
+            if not setup.description:
                 app.set_status("setup", "enter description")
-                desc_event = threading.Event()
-
-                def handle_description(desc):
-                    task_info["description"] = desc
-                    desc_event.set()
-
-                app.show_multiline_input(
-                    "Enter task description (Ctrl+S to submit):", "", handle_description
+                setup.description = (
+                    await app.multiline_input_async(
+                        "Enter task description (Ctrl+S to submit):", ""
+                    )
+                    or ""
                 )
-                desc_event.wait()
 
-                if not task_info["description"]:
+                if not setup.description:
                     app.show_message("Task description required", "error")
                     app._workflow_result = "cancelled"
-                    result_code["value"] = 1
-                    app.call_from_thread(app.set_timer, 0.5, app.exit)
+                    setup.exit_code = 1
+                    app.set_timer(0.5, app.exit)
                     return
 
             # Step 3: Generate task name if not provided
-            if not task_info["name"]:
+            if not setup.name:
                 app.set_status("setup", "generating task name")
                 app.show_message("Generating task name...", "info")
 
                 # Use prefix for GitHub issues
-                prefix = f"issue-{task_info['github_issue']}" if task_info["github_issue"] else None
-                task_info["name"] = generate_unique_task_name(task_info["description"], prefix)
+                prefix = f"issue-{setup.github_issue}" if setup.github_issue else None
+                setup.name = await asyncio.to_thread(
+                    generate_unique_task_name, setup.description, prefix
+                )
             else:
                 # Validate provided name for safety (prevent shell injection)
-                valid, error_msg = is_valid_task_name(task_info["name"])
+                valid, error_msg = is_valid_task_name(setup.name)
                 if not valid:
                     app.show_message(f"Invalid task name: {error_msg}", "error")
                     app._workflow_result = "cancelled"
-                    result_code["value"] = 1
-                    app.call_from_thread(app.set_timer, 0.5, app.exit)
+                    setup.exit_code = 1
+                    app.set_timer(0.5, app.exit)
                     return
 
                 # Check if name already exists
-                if task_name_exists(task_info["name"]):
-                    app.show_message(f"Task '{task_info['name']}' already exists", "error")
+                if task_name_exists(setup.name):
+                    app.show_message(f"Task '{setup.name}' already exists", "error")
                     app._workflow_result = "cancelled"
-                    result_code["value"] = 1
-                    app.call_from_thread(app.set_timer, 0.5, app.exit)
+                    setup.exit_code = 1
+                    app.set_timer(0.5, app.exit)
                     return
 
-            app.show_message(f"Task name: {task_info['name']}", "success")
-            debug_log("Task name generated", name=task_info["name"])
+            app.show_message(f"Task name: {setup.name}", "success")
+            debug_log("Task name generated", name=setup.name)
 
             # Step 4: Create the task (must happen BEFORE screenshot download
             # because download_issue_screenshots creates the task directory)
             app.set_status("setup", "creating task")
-            debug_log("Creating task", name=task_info["name"], type=str(task_info["type"]))
-            success, message = create_task(
-                task_info["name"],
-                task_info["description"],
-                task_info["type"],
-                github_issue=task_info["github_issue"],
-                github_repo=task_info["github_repo"],
+            debug_log("Creating task", name=setup.name, type=str(setup.type))
+            success, message = await asyncio.to_thread(
+                create_task,
+                setup.name,
+                setup.description,
+                setup.type,
+                github_issue=setup.github_issue,
+                github_repo=setup.github_repo,
             )
 
             if success:
                 app.show_message(message, "success")
                 app._workflow_result = "task_created"
-                debug_log("Task created successfully", name=task_info["name"])
+                debug_log("Task created successfully", name=setup.name)
 
                 # Step 4.5: Download screenshots if from GitHub issue
                 # (must happen AFTER task creation since it writes to task directory)
-                if task_info.get("_issue_body"):
+                if setup.issue_body:
                     app.set_status("setup", "downloading screenshots")
-                    issue_body = task_info["_issue_body"]
+                    issue_body = setup.issue_body
                     debug_log(
                         "Starting screenshot download",
                         body_length=len(issue_body),
@@ -460,20 +421,21 @@ def cmd_start(args: argparse.Namespace) -> int:
                     try:
                         from galangal.github.issues import download_issue_screenshots
 
-                        task_dir = get_task_dir(task_info["name"])
-                        screenshot_paths = download_issue_screenshots(
-                            task_info["_issue_body"],
+                        task_dir = get_task_dir(setup.name)
+                        screenshot_paths = await asyncio.to_thread(
+                            download_issue_screenshots,
+                            setup.issue_body,
                             task_dir,
                         )
                         if screenshot_paths:
-                            task_info["screenshots"] = screenshot_paths
+                            setup.screenshots = screenshot_paths
                             app.show_message(
                                 f"Downloaded {len(screenshot_paths)} screenshot(s)", "success"
                             )
                             debug_log("Screenshots downloaded", count=len(screenshot_paths))
 
                             # Update state with screenshot paths
-                            state = load_state(task_info["name"])
+                            state = load_state(setup.name)
                             if state:
                                 state.screenshots = screenshot_paths
                                 save_state(state)
@@ -483,11 +445,11 @@ def cmd_start(args: argparse.Namespace) -> int:
                         # Non-critical - continue without screenshots
 
                 # Mark issue as in-progress if from GitHub
-                if task_info["github_issue"]:
+                if setup.github_issue:
                     try:
                         from galangal.github.issues import mark_issue_in_progress
 
-                        mark_issue_in_progress(task_info["github_issue"])
+                        await asyncio.to_thread(mark_issue_in_progress, setup.github_issue)
                         app.show_message("Marked issue as in-progress", "info")
                     except Exception as e:
                         debug_exception("Failed to mark issue as in-progress", e)
@@ -495,39 +457,38 @@ def cmd_start(args: argparse.Namespace) -> int:
             else:
                 app.show_message(f"Failed: {message}", "error")
                 app._workflow_result = "error"
-                result_code["value"] = 1
+                setup.exit_code = 1
 
         except Exception as e:
             debug_exception("Task creation failed", e)
             app.show_message(f"Error: {e}", "error")
             app._workflow_result = "error"
-            result_code["value"] = 1
+            setup.exit_code = 1
         finally:
-            app.call_from_thread(app.set_timer, 0.5, app.exit)
+            app.set_timer(0.5, app.exit)
 
-    # Start creation in background thread
-    thread = threading.Thread(target=task_creation_thread, daemon=True)
-    app.call_later(thread.start)
+    # Run creation as an async worker on the app's event loop
+    app.call_later(lambda: app.run_worker(task_creation_loop(), exclusive=True))
     app.run()
 
     # Log the TUI result for debugging
     debug_log(
         "TUI app exited",
         result=getattr(app, "_workflow_result", "unknown"),
-        task_name=task_info.get("name", "none"),
-        result_code=result_code["value"],
+        task_name=setup.name,
+        result_code=setup.exit_code,
     )
 
     # If task was created, start the workflow
-    if app._workflow_result == "task_created" and task_info["name"]:
-        debug_log("Task created, loading state", task=task_info["name"])
-        state = load_state(task_info["name"])
+    if app._workflow_result == "task_created" and setup.name:
+        debug_log("Task created, loading state", task=setup.name)
+        state = load_state(setup.name)
         if state:
             # Pass skip_discovery flag via state attribute
             if getattr(args, "skip_discovery", False):
                 state._skip_discovery = True
             try:
-                debug_log("Starting workflow", task=task_info["name"])
+                debug_log("Starting workflow", task=setup.name)
                 run_workflow(state)
             except Exception as e:
                 debug_exception("Workflow failed to start", e)
@@ -536,11 +497,11 @@ def cmd_start(args: argparse.Namespace) -> int:
                 print_error(f"Workflow failed: {e}")
                 return 1
         else:
-            debug_log("Failed to load state", task=task_info["name"])
+            debug_log("Failed to load state", task=setup.name)
     else:
         debug_log(
             "Not starting workflow",
-            reason=f"result={getattr(app, '_workflow_result', 'unknown')}, name={task_info.get('name', 'none')}",
+            reason=f"result={getattr(app, '_workflow_result', 'unknown')}, name={setup.name}",
         )
 
-    return result_code["value"]
+    return setup.exit_code
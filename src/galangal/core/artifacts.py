@@ -30,6 +30,33 @@ def artifact_exists(name: str, task_name: str | None = None) -> bool:
         return False
 
 
+class ArtifactIndex:
+    """
+    Snapshot of the artifact filenames present in a task directory.
+
+    Answers repeated existence checks from a single ``os.scandir()`` instead of
+    one ``stat()`` per artifact. The snapshot is not live: call ``refresh()``
+    after artifacts may have been written by something else (e.g. an AI
+    backend).
+    """
+
+    def __init__(self, task_name: str) -> None:
+        self.task_name = task_name
+        self._names: set[str] = set()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-scan the task directory."""
+        try:
+            with os.scandir(get_task_dir(self.task_name)) as entries:
+                self._names = {entry.name for entry in entries}
+        except OSError:
+            self._names = set()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+
 def read_artifact(name: str, task_name: str | None = None) -> str | None:
     """Read an artifact file."""
     try:
@@ -63,9 +90,40 @@ def write_artifact(
     _record_lineage_if_enabled(name, content, task_name, stage)
 
 
-def _record_lineage_if_enabled(
+def append_artifact(
     name: str,
     content: str,
+    task_name: str | None = None,
+    header: str = "",
+    stage: str | None = None,
+) -> None:
+    """Append to an artifact file without reading or rewriting existing content.
+
+    Args:
+        name: Artifact filename.
+        content: Content to append.
+        task_name: Task name, or None to use active task.
+        header: Written before content only when this call creates the file.
+        stage: Optional stage that generated this artifact (for lineage tracking).
+    """
+    path = artifact_path(name, task_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        with open(path, "a") as f:
+            f.write(content)
+    else:
+        with os.fdopen(fd, "w") as f:
+            f.write(header + content)
+
+    # Lineage hashes the whole file, so it is read back only when tracking is on
+    _record_lineage_if_enabled(name, None, task_name, stage)
+
+
+def _record_lineage_if_enabled(
+    name: str,
+    content: str | None,
     task_name: str | None,
     stage: str | None,
 ) -> None:
@@ -73,7 +131,7 @@ def _record_lineage_if_enabled(
 
     Args:
         name: Artifact filename.
-        content: Content written.
+        content: Content written, or None to read the artifact back from disk.
         task_name: Task name.
         stage: Stage that generated this artifact.
     """
@@ -101,6 +159,9 @@ def _record_lineage_if_enabled(
         if state is None:
             return
 
+        if content is None:
+            content = artifact_path(name, task_name).read_text()
+
         # Determine stage from state if not provided
         if stage is None:
             stage = state.stage.value
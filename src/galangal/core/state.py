@@ -142,7 +142,10 @@ class Stage(str, Enum):
 
     @classmethod
     def from_str(cls, value: str) -> "Stage":
-        return cls(value.upper())
+        try:
+            return STAGE_BY_NAME[value.upper()]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
 
     @property
     def metadata(self) -> StageMetadata:
@@ -177,6 +180,12 @@ STAGE_ORDER = [
     Stage.COMPLETE,
 ]
 
+# Position of each stage in STAGE_ORDER, for O(1) ordering comparisons
+STAGE_INDEX: dict[Stage, int] = {stage: idx for idx, stage in enumerate(STAGE_ORDER)}
+
+# Stage lookup by upper-case value, for parsing stage names without exceptions
+STAGE_BY_NAME: dict[str, Stage] = {stage.value: stage for stage in Stage}
+
 
 # Rich metadata for each stage
 STAGE_METADATA: dict[Stage, StageMetadata] = {
@@ -787,6 +796,19 @@ class WorkflowState:
                 prompt size from exceeding shell argument limits (~128KB).
         """
         self.attempt += 1
+        self.set_failure(error, max_length)
+
+    def set_failure(self, error: str, max_length: int = 4000) -> None:
+        """
+        Store a failure message for retry context without changing the attempt.
+
+        Messages longer than ``max_length`` are truncated so state.json and
+        retry prompts stay small regardless of tool output size.
+
+        Args:
+            error: Failure message or feedback to pass to the next attempt.
+            max_length: Maximum characters to store (default 4000).
+        """
         if len(error) > max_length:
             self.last_failure = (
                 error[:max_length] + "\n\n[... truncated, see logs/ for full output]"
@@ -1140,15 +1162,40 @@ def load_state(task_name: str | None = None) -> WorkflowState | None:
         return None
 
 
+# Last state.json written by this process: path -> (content, (mtime_ns, size)).
+# Lets save_state skip rewriting a file whose content would not change.
+_saved_state_files: dict[Path, tuple[str, tuple[int, int]]] = {}
+
+
 def save_state(state: WorkflowState) -> None:
-    """Save workflow state for a task."""
+    """Save workflow state for a task.
+
+    The write is skipped when the serialized state is identical to what this
+    process last wrote and the file has not been modified since.
+    """
     task_dir = get_task_dir(state.task_name)
-    task_dir.mkdir(parents=True, exist_ok=True)
     state_file = task_dir / "state.json"
-    with open(state_file, "w") as f:
-        json.dump(state.to_dict(), f, indent=2)
+    content = json.dumps(state.to_dict(), indent=2)
+
+    if not _state_file_matches(state_file, content):
+        task_dir.mkdir(parents=True, exist_ok=True)
+        state_file.write_text(content)
+        stat = state_file.stat()
+        _saved_state_files[state_file] = (content, (stat.st_mtime_ns, stat.st_size))
 
     # Notify hub if connected
     from galangal.hub.hooks import notify_state_saved
 
     notify_state_saved(state)
+
+
+def _state_file_matches(state_file: Path, content: str) -> bool:
+    """Return True if state_file still holds exactly what save_state last wrote."""
+    cached = _saved_state_files.get(state_file)
+    if cached is None or cached[0] != content:
+        return False
+    try:
+        stat = state_file.stat()
+    except OSError:
+        return False
+    return (stat.st_mtime_ns, stat.st_size) == cached[1]
@@ -49,7 +49,7 @@ def debug_log(message: str, **context: object) -> None:
         logs_dir.mkdir(exist_ok=True)
         _debug_file = logs_dir / "galangal_debug.log"
 
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    timestamp = datetime.now().time().isoformat("milliseconds")  # HH:MM:SS.mmm
     context_str = " ".join(f"{k}={v}" for k, v in context.items()) if context else ""
     line = f"[{timestamp}] {message}"
     if context_str:
@@ -10,8 +10,16 @@ from typing import TYPE_CHECKING, Any
 from galangal.ai import get_backend_for_stage
 from galangal.ai.base import PauseCheck
 from galangal.config.loader import get_config
-from galangal.core.artifacts import artifact_exists, artifact_path, read_artifact, write_artifact
+from galangal.core.artifacts import (
+    ArtifactIndex,
+    append_artifact,
+    artifact_exists,
+    artifact_path,
+    write_artifact,
+)
 from galangal.core.state import (
+    STAGE_BY_NAME,
+    STAGE_INDEX,
     STAGE_ORDER,
     Stage,
     WorkflowState,
@@ -27,27 +35,46 @@ from galangal.ui.tui import TUIAdapter
 from galangal.validation.runner import ValidationRunner
 
 if TYPE_CHECKING:
+    from galangal.config.schema import GalangalConfig
     from galangal.ui.tui import WorkflowTUIApp
 
 
 # Get conditional stages from metadata (cached at module load)
 CONDITIONAL_STAGES: dict[Stage, str] = get_conditional_stages()
 
+# Written once, when append_rollback_entry creates ROLLBACK.md
+_ROLLBACK_LOG_HEADER = (
+    "# Rollback Log\n\nThis file tracks issues that required rolling back to earlier stages.\n"
+)
+
+# Appended to the stage prompt when retrying after a failed attempt
+_RETRY_CONTEXT_TEMPLATE = """
+## ⚠️ RETRY ATTEMPT {attempt}
+
+The previous attempt failed with the following error:
+
+```
+{failure}
+```
+
+Please fix the issue above before proceeding. Do not repeat the same mistake.
+"""
+
 
 def _format_issues(issues: list[dict[str, Any]]) -> str:
     """Format issues list into markdown."""
     if not issues:
         return ""
 
-    formatted = "\n\n## Issues Found\n\n"
+    parts = ["\n\n## Issues Found\n\n"]
     for issue in issues:
         severity = issue.get("severity", "unknown")
         desc = issue.get("description", "")
         file_ref = issue.get("file", "")
         line = issue.get("line")
         loc = f" ({file_ref}:{line})" if file_ref and line else ""
-        formatted += f"- **[{severity.upper()}]** {desc}{loc}\n"
-    return formatted
+        parts.append(f"- **[{severity.upper()}]** {desc}{loc}\n")
+    return "".join(parts)
 
 
 def _write_artifacts_from_readonly_output(
@@ -160,7 +187,14 @@ def _write_generic_artifacts(
             tui_app.add_activity(f"Wrote {name} from backend output", "📝")
 
 
-def get_next_stage(current: Stage, state: WorkflowState) -> Stage | None:
+def get_next_stage(
+    current: Stage,
+    state: WorkflowState,
+    *,
+    runner: ValidationRunner | None = None,
+    config: GalangalConfig | None = None,
+    skip_upper: frozenset[str] | None = None,
+) -> Stage | None:
     """
     Determine the next stage in the workflow pipeline.
 
@@ -181,20 +215,32 @@ def get_next_stage(current: Stage, state: WorkflowState) -> Stage | None:
     Args:
         current: The stage that just completed.
         state: Current workflow state containing task_name and task_type.
+        runner: Optional ValidationRunner to reuse across calls. A new one is
+            created when not provided.
+        config: Optional resolved config. Loaded via get_config() when not
+            provided.
+        skip_upper: Optional precomputed set of upper-cased config.stages.skip
+            names. Computed from config when not provided.
 
     Returns:
         The next stage to execute, or None if current is the last stage.
     """
-    config = get_config()
+    config = config or get_config()
     task_name = state.task_name
     task_type = state.task_type
-    start_idx = STAGE_ORDER.index(current) + 1
-    config_skip_stages = [s.upper() for s in config.stages.skip]
-    runner = ValidationRunner()  # Create once for all skip_if checks
+    start_idx = STAGE_INDEX[current] + 1
+    if skip_upper is None:
+        skip_upper = frozenset(s.upper() for s in config.stages.skip)
+    if runner is None:
+        runner = ValidationRunner()  # Create once for all skip_if checks
+    else:
+        runner.invalidate_changed_files()  # Working tree may have changed since last walk
+    artifacts = ArtifactIndex(task_name)  # One directory scan for all skip artifacts
+    stage_plan = state.stage_plan or {}
 
     for next_stage in STAGE_ORDER[start_idx:]:
         # Check 1: config-level skipping
-        if next_stage.value in config_skip_stages:
+        if next_stage.value in skip_upper:
             continue
 
         # Check 2: task type skipping
@@ -206,16 +252,14 @@ def get_next_stage(current: Stage, state: WorkflowState) -> Stage | None:
             continue
 
         # Check 4: PM-driven stage plan (STAGE_PLAN.md recommendations)
-        if state.stage_plan and next_stage.value in state.stage_plan:
-            if state.stage_plan[next_stage.value].get("action") == "skip":
-                continue
+        plan_entry = stage_plan.get(next_stage.value)
+        if plan_entry and plan_entry.get("action") == "skip":
+            continue
 
         # Check 5: manual skip artifacts (e.g., MIGRATION_SKIP.md from galangal skip-*)
         # Uses metadata as source of truth for which stages have skip artifacts
         stage_metadata = next_stage.metadata
-        if stage_metadata.skip_artifact and artifact_exists(
-            stage_metadata.skip_artifact, task_name
-        ):
+        if stage_metadata.skip_artifact and stage_metadata.skip_artifact in artifacts:
             continue
 
         # Check 6: TEST_GATE - skip if not enabled or no tests configured
@@ -225,9 +269,8 @@ def get_next_stage(current: Stage, state: WorkflowState) -> Stage | None:
 
         # Check 7: for conditional stages, if PM explicitly said "run", skip the glob check
         if next_stage in CONDITIONAL_STAGES:
-            if state.stage_plan and next_stage.value in state.stage_plan:
-                if state.stage_plan[next_stage.value].get("action") == "run":
-                    return next_stage  # PM says run, skip the glob check
+            if plan_entry and plan_entry.get("action") == "run":
+                return next_stage  # PM says run, skip the glob check
 
         # Check 8: skip_if conditions for ALL stages (glob-based skipping)
         # This is the single place where skip_if is evaluated
@@ -514,6 +557,8 @@ def execute_stage(
     state: WorkflowState,
     tui_app: WorkflowTUIApp,
     pause_check: PauseCheck | None = None,
+    runner: ValidationRunner | None = None,
+    config: GalangalConfig | None = None,
 ) -> StageResult:
     """
     Execute a single workflow stage and validate its output.
@@ -535,6 +580,10 @@ def execute_stage(
         tui_app: TUI application instance for displaying progress and messages.
         pause_check: Optional callback that returns True if a pause was requested
             (e.g., user pressed Ctrl+C). Passed to ClaudeBackend for graceful stop.
+        runner: Optional ValidationRunner to reuse. A new one is created when
+            not provided.
+        config: Optional resolved config. Loaded via get_config() when not
+            provided.
 
     Returns:
         StageResult with one of:
@@ -545,11 +594,14 @@ def execute_stage(
         - CLARIFICATION_NEEDED: Questions pending without answers
         - PAUSED/TIMEOUT/ERROR: AI execution issues
     """
+    stage = state.stage
+    if stage == Stage.COMPLETE:
+        return StageResult.create_success("Workflow complete")
+
     from galangal.logging import workflow_logger
 
-    stage = state.stage
     task_name = state.task_name
-    config = get_config()
+    config = config or get_config()
     start_time = time.time()
 
     # Log stage start
@@ -560,9 +612,6 @@ def execute_stage(
         max_retries=config.stages.max_retries,
     )
 
-    if stage == Stage.COMPLETE:
-        return StageResult.create_success("Workflow complete")
-
     # NOTE: Skip conditions are checked in get_next_stage() which is the single
     # source of truth for skip logic. By the time we reach execute_stage(),
     # the stage has already been determined to not be skipped.
@@ -577,7 +626,7 @@ def execute_stage(
     if stage == Stage.PREFLIGHT:
         tui_app.add_activity("Running preflight checks...", "⚙")
 
-        runner = ValidationRunner()
+        runner = runner or ValidationRunner()
         result = runner.validate_stage("PREFLIGHT", task_name)
 
         if result.success:
@@ -610,17 +659,9 @@ def execute_stage(
 
     # Add retry context
     if state.attempt > 1 and state.last_failure:
-        retry_context = f"""
-## ⚠️ RETRY ATTEMPT {state.attempt}
-
-The previous attempt failed with the following error:
-
-```
-{state.last_failure[:1000]}
-```
-
-Please fix the issue above before proceeding. Do not repeat the same mistake.
-"""
+        retry_context = _RETRY_CONTEXT_TEMPLATE.format(
+            attempt=state.attempt, failure=state.last_failure[:1000]
+        )
         prompt = f"{prompt}\n\n{retry_context}"
 
     # Set up log file for streaming output
@@ -666,7 +707,7 @@ Please fix the issue above before proceeding. Do not repeat the same mistake.
     # Validate stage
     tui_app.add_activity("Validating stage outputs...", "⚙")
 
-    runner = ValidationRunner()
+    runner = runner or ValidationRunner()
     result = runner.validate_stage(stage.value, task_name)
 
     # Log validation details including rollback_to for debugging
@@ -719,9 +760,16 @@ Please fix the issue above before proceeding. Do not repeat the same mistake.
         if result.rollback_to:
             rollback_type = "fast-track rollback" if result.is_fast_track else "rollback"
             tui_app.add_activity(f"Triggering {rollback_type} to {result.rollback_to}", "🔄")
+            rollback_stage = STAGE_BY_NAME.get(result.rollback_to.strip().upper())
+            if rollback_stage is None:
+                tui_app.add_activity(
+                    f"Warning: Unknown rollback target '{result.rollback_to}', using DEV",
+                    "⚠️",
+                )
+                rollback_stage = Stage.DEV
             return StageResult.rollback_required(
                 message=result.message,
-                rollback_to=Stage.from_str(result.rollback_to),
+                rollback_to=rollback_stage,
                 output=invoke_result.output,
                 is_fast_track=result.is_fast_track,
             )
@@ -741,7 +789,7 @@ def append_rollback_entry(
     Append a rollback entry to ROLLBACK.md, preserving history.
 
     Creates a structured entry documenting the rollback event and appends it
-    to existing ROLLBACK.md content (or creates new file if none exists).
+    to ROLLBACK.md, writing the log header only when the file is created.
 
     Args:
         task_name: Name of the task.
@@ -764,13 +812,12 @@ def append_rollback_entry(
 {reason}
 """
 
-    existing = read_artifact("ROLLBACK.md", task_name)
-    if existing:
-        new_content = existing + rollback_entry
-    else:
-        new_content = f"# Rollback Log\n\nThis file tracks issues that required rolling back to earlier stages.\n{rollback_entry}"
-
-    write_artifact("ROLLBACK.md", new_content, task_name)
+    append_artifact(
+        "ROLLBACK.md",
+        rollback_entry,
+        task_name,
+        header=_ROLLBACK_LOG_HEADER,
+    )
 
 
 def archive_rollback_if_exists(task_name: str, tui_app: WorkflowTUIApp) -> None:
@@ -789,21 +836,24 @@ def archive_rollback_if_exists(task_name: str, tui_app: WorkflowTUIApp) -> None:
         task_name: Name of the task to archive rollback for.
         tui_app: TUI app for displaying archive notification.
     """
-    if not artifact_exists("ROLLBACK.md", task_name):
+    rollback_path = artifact_path("ROLLBACK.md", task_name)
+    try:
+        # Copied as bytes: the log is moved verbatim, so there is nothing to decode
+        rollback_content = rollback_path.read_bytes()
+    except FileNotFoundError:
         return
 
-    rollback_content = read_artifact("ROLLBACK.md", task_name) or ""
     resolved_path = artifact_path("ROLLBACK_RESOLVED.md", task_name)
 
     resolution_note = f"\n\n## Resolved: {now_iso()}\n\nIssues fixed by DEV stage.\n"
 
-    if resolved_path.exists():
-        existing = resolved_path.read_text()
-        resolved_path.write_text(existing + "\n---\n" + rollback_content + resolution_note)
-    else:
-        resolved_path.write_text(rollback_content + resolution_note)
+    # Append only the new entry; earlier resolved rollbacks are never rewritten
+    with open(resolved_path, "ab") as f:
+        if f.tell():
+            f.write(b"\n---\n")
+        f.write(rollback_content)
+        f.write(resolution_note.encode())
 
-    rollback_path = artifact_path("ROLLBACK.md", task_name)
     rollback_path.unlink()
 
     tui_app.add_activity("Archived ROLLBACK.md → ROLLBACK_RESOLVED.md", "📋")
@@ -899,7 +949,7 @@ def handle_rollback(state: WorkflowState, result: StageResult) -> bool:
     )
 
     state.stage = target_stage
-    state.last_failure = f"Rollback from {from_stage.value}: {reason}"
+    state.set_failure(f"Rollback from {from_stage.value}: {reason}")
     state.reset_attempts(clear_failure=False)
     save_state(state)
 
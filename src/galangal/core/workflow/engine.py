@@ -21,6 +21,7 @@ from galangal.config.loader import get_config
 from galangal.config.schema import GalangalConfig
 from galangal.core.artifacts import artifact_exists, parse_stage_plan, read_artifact, write_artifact
 from galangal.core.state import (
+    STAGE_INDEX,
     STAGE_ORDER,
     Stage,
     WorkflowState,
@@ -38,6 +39,7 @@ from galangal.core.workflow.core import (
     execute_stage as _execute_stage,
 )
 from galangal.results import StageResult, StageResultType
+from galangal.validation.runner import ValidationRunner
 
 if TYPE_CHECKING:
     from galangal.ai.base import PauseCheck
@@ -191,6 +193,17 @@ class WorkflowEngine:
         self.state = state
         self.config = config or get_config()
         self._pending_result: StageResult | None = None
+        self._validation_runner: ValidationRunner | None = None
+        self._skip_upper = frozenset(s.upper() for s in self.config.stages.skip)
+        # Approval artifacts known to exist; they are never removed mid-run
+        self._approved_artifacts: set[str] = set()
+
+    @property
+    def validation_runner(self) -> ValidationRunner:
+        """ValidationRunner shared by every stage and transition in this run."""
+        if self._validation_runner is None:
+            self._validation_runner = ValidationRunner()
+        return self._validation_runner
 
     @property
     def current_stage(self) -> Stage:
@@ -254,7 +267,13 @@ class WorkflowEngine:
         Returns:
             WorkflowEvent describing the execution result.
         """
-        result = _execute_stage(self.state, tui_app=tui_app, pause_check=pause_check)
+        result = _execute_stage(
+            self.state,
+            tui_app=tui_app,
+            pause_check=pause_check,
+            runner=self.validation_runner,
+            config=self.config,
+        )
         self._pending_result = result
         return self._process_stage_result(result)
 
@@ -268,13 +287,19 @@ class WorkflowEngine:
         if result.success:
             # Check if approval is needed
             metadata = stage.metadata
-            if metadata.requires_approval and metadata.approval_artifact:
-                if not artifact_exists(metadata.approval_artifact, self.state.task_name):
+            approval_artifact = metadata.approval_artifact
+            if (
+                metadata.requires_approval
+                and approval_artifact
+                and approval_artifact not in self._approved_artifacts
+            ):
+                if not artifact_exists(approval_artifact, self.state.task_name):
                     return event(
                         EventType.APPROVAL_REQUIRED,
                         stage=stage,
-                        artifact_name=metadata.approval_artifact,
+                        artifact_name=approval_artifact,
                     )
+                self._approved_artifacts.add(approval_artifact)
             return event(EventType.STAGE_COMPLETED, stage=stage, message=result.message)
 
         # Handle different failure types
@@ -480,7 +505,13 @@ class WorkflowEngine:
             self.state.clear_passed_stages()
 
         # Find next stage
-        next_stage = get_next_stage(current, self.state)
+        next_stage = get_next_stage(
+            current,
+            self.state,
+            runner=self.validation_runner,
+            config=self.config,
+            skip_upper=self._skip_upper,
+        )
         skipped_stages = self._get_skipped_stages(current, next_stage)
 
         if next_stage:
@@ -509,8 +540,8 @@ class WorkflowEngine:
         if next_stage is None:
             return []
 
-        current_idx = STAGE_ORDER.index(current)
-        next_idx = STAGE_ORDER.index(next_stage)
+        current_idx = STAGE_INDEX[current]
+        next_idx = STAGE_INDEX[next_stage]
 
         if next_idx > current_idx + 1:
             return STAGE_ORDER[current_idx + 1 : next_idx]
@@ -591,7 +622,13 @@ class WorkflowEngine:
     def _handle_skip(self) -> WorkflowEvent:
         """Handle skip stage action (Ctrl+N)."""
         skipped_stage = self.state.stage
-        next_stage = get_next_stage(self.state.stage, self.state)
+        next_stage = get_next_stage(
+            self.state.stage,
+            self.state,
+            runner=self.validation_runner,
+            config=self.config,
+            skip_upper=self._skip_upper,
+        )
 
         if next_stage:
             self.state.stage = next_stage
@@ -609,7 +646,7 @@ class WorkflowEngine:
 
     def _handle_back(self) -> WorkflowEvent:
         """Handle back stage action (Ctrl+B)."""
-        current_idx = STAGE_ORDER.index(self.state.stage)
+        current_idx = STAGE_INDEX[self.state.stage]
         if current_idx > 0:
             prev_stage = STAGE_ORDER[current_idx - 1]
             self.state.stage = prev_stage
@@ -633,7 +670,7 @@ class WorkflowEngine:
         interrupted_stage = self.state.stage
 
         # Determine valid rollback targets
-        current_idx = STAGE_ORDER.index(interrupted_stage)
+        current_idx = STAGE_INDEX[interrupted_stage]
         valid_targets = [s for s in STAGE_ORDER[:current_idx] if s != Stage.PREFLIGHT]
 
         # Use provided target or determine default
@@ -659,7 +696,7 @@ class WorkflowEngine:
         )
 
         self.state.stage = target_stage
-        self.state.last_failure = f"Interrupt feedback from {interrupted_stage.value}: {feedback}"
+        self.state.set_failure(f"Interrupt feedback from {interrupted_stage.value}: {feedback}")
         self.state.reset_attempts(clear_failure=False)
         save_state(self.state)
 
@@ -723,6 +760,7 @@ class WorkflowEngine:
 """
             if approval_artifact:
                 write_artifact(approval_artifact, content, self.state.task_name)
+                self._approved_artifacts.add(approval_artifact)
 
             # PM-specific: Parse and store stage plan
             if stage == Stage.PM:
@@ -740,7 +778,7 @@ class WorkflowEngine:
 
         else:
             # Rejected
-            self.state.last_failure = f"{stage.value} rejected: {reason}"
+            self.state.set_failure(f"{stage.value} rejected: {reason}")
             self.state.reset_attempts(clear_failure=False)
             save_state(self.state)
 
@@ -761,9 +799,7 @@ class WorkflowEngine:
         ]
 
         self.state.stage = Stage.DEV
-        self.state.last_failure = (
-            f"Manual rollback from {original_stage}: {feedback or error[:500]}"
-        )
+        self.state.set_failure(f"Manual rollback from {original_stage}: {feedback or error[:500]}")
         self.state.reset_attempts(clear_failure=False)
         save_state(self.state)
 
@@ -892,7 +928,7 @@ class WorkflowEngine:
 
     def get_valid_interrupt_targets(self) -> list[Stage]:
         """Get valid rollback targets for interrupt."""
-        current_idx = STAGE_ORDER.index(self.state.stage)
+        current_idx = STAGE_INDEX[self.state.stage]
         valid: list[Stage] = [s for s in STAGE_ORDER[:current_idx] if s != Stage.PREFLIGHT]
 
         if self.state.stage == Stage.PM:
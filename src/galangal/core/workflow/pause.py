@@ -11,6 +11,14 @@ console = Console()
 # Stages that modify code and benefit from resume context
 CODE_MODIFYING_STAGES = {Stage.DEV, Stage.TEST, Stage.DOCS, Stage.REVIEW}
 
+_SEPARATOR = "=" * 60
+_PAUSED_HEADER = f"\n{_SEPARATOR}\n[yellow]⏸️  TASK PAUSED[/yellow]\n{_SEPARATOR}"
+_PAUSED_FOOTER = (
+    "\nYour progress has been saved. You can safely shut down now.\n"
+    "\nTo resume later, run:\n"
+    f"  [cyan]galangal resume[/cyan]\n{_SEPARATOR}"
+)
+
 
 def _handle_pause(state: WorkflowState) -> None:
     """Handle a pause request. Called after TUI exits."""
@@ -24,12 +32,9 @@ def _handle_pause(state: WorkflowState) -> None:
 
     save_state(state)
 
-    console.print("\n" + "=" * 60)
-    console.print("[yellow]⏸️  TASK PAUSED[/yellow]")
-    console.print("=" * 60)
-    console.print(f"\nTask: {state.task_name}")
-    console.print(f"Stage: {state.stage.value} (attempt {state.attempt})")
-    console.print("\nYour progress has been saved. You can safely shut down now.")
-    console.print("\nTo resume later, run:")
-    console.print("  [cyan]galangal resume[/cyan]")
-    console.print("=" * 60)
+    console.print(
+        f"{_PAUSED_HEADER}\n"
+        f"\nTask: {state.task_name}\n"
+        f"Stage: {state.stage.value} (attempt {state.attempt})\n"
+        f"{_PAUSED_FOOTER}"
+    )
@@ -13,14 +13,18 @@ transitions. This module is responsible for:
 """
 
 import asyncio
+import json
+import re
+from itertools import islice
 from typing import Any
 
 from rich.console import Console
 
 from galangal.config.loader import get_config
 from galangal.config.schema import GalangalConfig
-from galangal.core.artifacts import parse_stage_plan, write_artifact
+from galangal.core.artifacts import parse_stage_plan, read_artifact, write_artifact
 from galangal.core.state import (
+    STAGE_INDEX,
     STAGE_ORDER,
     TASK_TYPE_SKIP_STAGES,
     Stage,
@@ -29,8 +33,12 @@ from galangal.core.state import (
     get_conditional_stages,
     get_hidden_stages_for_task_type,
     get_task_dir,
+    load_state,
     save_state,
 )
+from galangal.core.tasks import generate_unique_task_name
+from galangal.core.utils import debug_exception, now_formatted
+from galangal.core.workflow.core import append_rollback_entry
 from galangal.core.workflow.engine import (
     ActionType,
     EventType,
@@ -40,11 +48,14 @@ from galangal.core.workflow.engine import (
 )
 from galangal.core.workflow.pause import _handle_pause
 from galangal.prompts.builder import PromptBuilder
-from galangal.ui.tui import PromptType, WorkflowTUIApp
+from galangal.ui.tui import PromptType, TUIAdapter, WorkflowTUIApp
 from galangal.validation.runner import ValidationRunner
 
 console = Console()
 
+# Lines in preflight output that describe a failed check
+_PREFLIGHT_FAILURE_RE = re.compile(r"^\s*✗|Failed|Missing|Error")
+
 
 async def _init_hub_client(config: GalangalConfig, state: WorkflowState) -> None:
     """Initialize hub client if configured."""
@@ -229,8 +240,6 @@ def _run_workflow_with_tui(
                 await _handle_workflow_complete(app, state)
 
         except Exception as e:
-            from galangal.core.utils import debug_exception
-
             debug_exception("Workflow execution failed", e)
             app.show_error("Workflow error", str(e))
             app._workflow_result = "error"
@@ -363,7 +372,8 @@ async def _handle_workflow_event(
 
             if choice == "view":
                 app.add_activity("--- Full Report ---", "📄")
-                for line in (full_content or "No content").split("\n")[:50]:
+                # maxsplit stops splitting after the lines that are shown
+                for line in (full_content or "No content").split("\n", 50)[:50]:
                     app.add_activity(line, "")
                 app.add_activity("--- End Report ---", "📄")
                 continue
@@ -502,14 +512,15 @@ async def _handle_advance_event(
     if event.type == EventType.STAGE_STARTED:
         # Show skipped stages if any
         skipped = event.data.get("skipped_stages", [])
-        for s in skipped:
-            app.show_message(f"Skipped {s.value} (condition not met)", "info")
+        if skipped:
+            names = ", ".join(s.value for s in skipped)
+            app.show_message(f"Skipped {names} (condition not met)", "info")
 
         app.update_stage(state.stage.value, state.attempt)
 
         # After PM approval, show stage preview
         if event.data.get("show_preview"):
-            preview_result = await _show_stage_preview(app, state, config)
+            preview_result = await _show_stage_preview(app, state, config, engine.validation_runner)
             if preview_result == "quit":
                 app._workflow_result = "paused"
                 return "break"
@@ -596,7 +607,7 @@ async def _handle_user_interrupts(app: WorkflowTUIApp, engine: WorkflowEngine) -
 
     # Handle back stage (Ctrl+B)
     if app._back_stage_requested:
-        current_idx = STAGE_ORDER.index(state.stage)
+        current_idx = STAGE_INDEX[state.stage]
         if current_idx > 0:
             result_event = engine.handle_action(action(ActionType.BACK))
             app.add_activity(f"Going back to {state.stage.value}", "⏮️")
@@ -834,8 +845,6 @@ async def _generate_discovery_questions(
         List of questions, empty list if AI found no gaps, or None if failed.
     """
     from galangal.ai import get_backend_with_fallback
-    from galangal.config.loader import get_config
-    from galangal.ui.tui import TUIAdapter
 
     prompt = builder.build_discovery_prompt(state, qa_history)
     config = get_config()
@@ -877,9 +886,6 @@ def _parse_discovery_questions(output: str) -> list[str]:
     The output may be raw JSON stream from Claude CLI, so we first
     extract text content from any JSON lines before parsing.
     """
-    import json
-    import re
-
     # First, extract text content from JSON stream if present
     # Only extract from assistant messages - result messages duplicate content
     text_content = []
@@ -1005,14 +1011,12 @@ def _write_discovery_log(task_name: str, qa_rounds: list[dict[str, Any]]) -> Non
 
 def _build_preflight_error_message(message: str, details: str) -> str:
     """Build error message for preflight failure modal."""
-    failed_lines = []
-    for line in details.split("\n"):
-        if line.strip().startswith("✗") or "Failed" in line or "Missing" in line or "Error" in line:
-            failed_lines.append(line.strip())
+    failures = (line.strip() for line in details.split("\n") if _PREFLIGHT_FAILURE_RE.search(line))
+    failed_lines = list(islice(failures, 10))
 
     modal_message = "Preflight checks failed:\n\n"
     if failed_lines:
-        modal_message += "\n".join(failed_lines[:10])
+        modal_message += "\n".join(failed_lines)
     else:
         modal_message += details[:500]
     modal_message += "\n\nFix issues and retry?"
@@ -1023,6 +1027,7 @@ def _build_preflight_error_message(message: str, details: str) -> str:
 def _get_skip_reasons(
     state: WorkflowState,
     config: GalangalConfig,
+    runner: ValidationRunner | None = None,
 ) -> dict[str, str]:
     """
     Get a mapping of stage names to their skip reasons.
@@ -1036,6 +1041,9 @@ def _get_skip_reasons(
     Args:
         state: Current workflow state with task_type and stage_plan.
         config: Configuration with stages.skip list.
+        runner: Optional ValidationRunner whose changed-file snapshot is still
+            current (e.g. the engine's, right after get_next_stage). A new one
+            is created when not provided.
 
     Returns:
         Dict mapping stage name -> reason string (e.g., "task type: bug_fix")
@@ -1065,7 +1073,7 @@ def _get_skip_reasons(
     # 4. skip_if conditions for conditional stages
     # Only check stages not already skipped by other means
     conditional_stages = get_conditional_stages()
-    runner = ValidationRunner()
+    runner = runner or ValidationRunner()
 
     for stage in conditional_stages:
         if stage.value not in skip_reasons:
@@ -1090,6 +1098,7 @@ async def _show_stage_preview(
     app: WorkflowTUIApp,
     state: WorkflowState,
     config: GalangalConfig,
+    runner: ValidationRunner | None = None,
 ) -> str:
     """
     Show a preview of stages to run before continuing.
@@ -1100,7 +1109,7 @@ async def _show_stage_preview(
     Returns "continue" or "quit".
     """
     # Get all skip reasons (includes skip_if conditions)
-    skip_reasons = _get_skip_reasons(state, config)
+    skip_reasons = _get_skip_reasons(state, config, runner)
 
     # Update hidden stages to include skip_if-based skips
     # This ensures the progress bar reflects the preview
@@ -1181,7 +1190,7 @@ async def _handle_max_retries_exceeded(
 
         failing_stage = state.stage.value
         state.stage = Stage.DEV
-        state.last_failure = (
+        state.set_failure(
             f"Feedback from {failing_stage} failure: {feedback}\n\n"
             f"Original error:\n{error_message[:1500]}"
         )
@@ -1243,8 +1252,6 @@ async def _handle_stage_approval(
             name = await app.text_input_async("Enter approver name:", default_approver)
 
         if name:
-            from galangal.core.utils import now_formatted
-
             approval_content = f"""# {stage_name} Approval
 
 - **Status:** Approved
@@ -1295,7 +1302,7 @@ async def _handle_stage_approval(
             )
 
         if reason:
-            state.last_failure = f"{stage_name} rejected: {reason}"
+            state.set_failure(f"{stage_name} rejected: {reason}")
             state.reset_attempts(clear_failure=False)
             save_state(state)
             app.show_message(f"{stage_name} rejected: {reason}", "warning")
@@ -1317,7 +1324,6 @@ def _send_artifacts_for_approval(
 ) -> None:
     """Send relevant artifacts to hub for display during approval."""
     try:
-        from galangal.core.artifacts import read_artifact
         from galangal.hub.hooks import notify_artifacts_updated
 
         artifacts: dict[str, str] = {}
@@ -1354,8 +1360,6 @@ def _send_artifacts_for_approval(
 
 async def _handle_workflow_complete(app: WorkflowTUIApp, state: WorkflowState) -> None:
     """Handle workflow completion - finalization and post-completion options."""
-    from galangal.core.artifacts import read_artifact
-
     # Clear fast-track state on completion
     state.clear_fast_track()
     state.clear_passed_stages()
@@ -1424,8 +1428,6 @@ async def _handle_workflow_complete(app: WorkflowTUIApp, state: WorkflowState) -
 
         if feedback:
             # Append to ROLLBACK.md (preserves history from earlier failures)
-            from galangal.core.workflow.core import append_rollback_entry
-
             append_rollback_entry(
                 task_name=state.task_name,
                 source="Manual review at COMPLETE stage",
@@ -1433,7 +1435,7 @@ async def _handle_workflow_complete(app: WorkflowTUIApp, state: WorkflowState) -
                 target_stage="DEV",
                 reason=feedback,
             )
-            state.last_failure = f"Manual review feedback: {feedback}"
+            state.set_failure(f"Manual review feedback: {feedback}")
             app.show_message("Feedback recorded, rolling back to DEV", "warning")
         else:
             state.last_failure = "Manual review requested changes (no details provided)"
@@ -1622,8 +1624,6 @@ def _start_new_task_tui() -> str:
                             )
 
                 except Exception as e:
-                    from galangal.core.utils import debug_exception
-
                     debug_exception("GitHub integration failed in new task flow", e)
                     app.show_message(f"GitHub error: {e}", "error")
                     app._workflow_result = "error"
@@ -1663,7 +1663,6 @@ def _start_new_task_tui() -> str:
             # Step 3: Generate task name
             app.set_status("setup", "generating task name")
             from galangal.commands.start import create_task
-            from galangal.core.tasks import generate_unique_task_name
 
             # Use prefix for GitHub issues
             prefix = f"issue-{task_info['github_issue']}" if task_info["github_issue"] else None
@@ -1691,8 +1690,6 @@ def _start_new_task_tui() -> str:
                             "success",
                         )
                 except Exception as e:
-                    from galangal.core.utils import debug_exception
-
                     debug_exception("Screenshot download failed", e)
                     app.show_message(f"Screenshot download failed: {e}", "warning")
                     # Non-critical - continue without screenshots
@@ -1721,8 +1718,6 @@ def _start_new_task_tui() -> str:
                         await asyncio.to_thread(mark_issue_in_progress, task_info["github_issue"])
                         app.show_message("Marked issue as in-progress", "info")
                     except Exception as e:
-                        from galangal.core.utils import debug_exception
-
                         debug_exception("Failed to mark issue as in-progress", e)
                         # Non-critical - continue anyway
             else:
@@ -1730,8 +1725,6 @@ def _start_new_task_tui() -> str:
                 app._workflow_result = "error"
 
         except Exception as e:
-            from galangal.core.utils import debug_exception
-
             debug_exception("Task creation failed in new task flow", e)
             app.show_error("Task creation error", str(e))
             app._workflow_result = "error"
@@ -1747,8 +1740,6 @@ def _start_new_task_tui() -> str:
     result = app._workflow_result or "cancelled"
 
     if result == "task_created" and task_info["name"]:
-        from galangal.core.state import load_state
-
         new_state = load_state(task_info["name"])
         if new_state:
             return _run_workflow_with_tui(new_state)
@@ -1785,7 +1776,6 @@ async def _handle_remote_task_create(
         pending_task: PendingTaskCreate with the remote data.
     """
     from galangal.commands.start import create_task
-    from galangal.core.tasks import generate_unique_task_name
 
     try:
         # Extract data from pending task
@@ -1871,8 +1861,6 @@ async def _handle_remote_task_create(
                         "success",
                     )
             except Exception as e:
-                from galangal.core.utils import debug_exception
-
                 debug_exception("Screenshot download failed", e)
                 app.show_message(f"Screenshot download failed: {e}", "warning")
 
@@ -1906,8 +1894,6 @@ async def _handle_remote_task_create(
             app._workflow_result = "error"
 
     except Exception as e:
-        from galangal.core.utils import debug_exception
-
         debug_exception("Remote task creation failed", e)
         app.show_error("Task creation error", str(e))
         app._workflow_result = "error"
@@ -2,6 +2,7 @@
 Prompt building with project override support.
 """
 
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,22 @@ from galangal.config.loader import get_config, get_project_root, get_prompts_dir
 from galangal.core.artifacts import artifact_exists, read_artifact
 from galangal.core.state import Stage, WorkflowState
 
+_DEFAULTS_DIR = Path(__file__).parent / "defaults"
+
+
+@cache
+def _read_default_prompt(defaults_dir: Path, name: str) -> str | None:
+    """Read a built-in prompt from the package, or None if it doesn't exist.
+
+    Built-in prompts never change while galangal runs, so each one is read
+    from disk at most once. Project prompts are not cached since users may
+    edit them between stages.
+    """
+    try:
+        return (defaults_dir / f"{name}.md").read_text()
+    except FileNotFoundError:
+        return None
+
 
 class PromptBuilder:
     """
@@ -40,7 +57,7 @@ class PromptBuilder:
         self.config = get_config()
         self.project_root = get_project_root()
         self.override_dir = get_prompts_dir()
-        self.defaults_dir = Path(__file__).parent / "defaults"
+        self.defaults_dir = _DEFAULTS_DIR
 
     def _merge_with_base(self, project_prompt: str, base_prompt: str) -> str:
         """Merge project prompt with base using # BASE marker.
@@ -87,10 +104,7 @@ class PromptBuilder:
             Prompt content with project overrides applied.
         """
         # Get base prompt
-        default_path = self.defaults_dir / f"{name}.md"
-        base_prompt = ""
-        if default_path.exists():
-            base_prompt = default_path.read_text()
+        base_prompt = _read_default_prompt(self.defaults_dir, name) or ""
 
         # Check for project prompt
         project_path = self.override_dir / f"{name}.md"
@@ -212,9 +226,9 @@ class PromptBuilder:
 
         base_prompt = ""
         for prompt_name in prompt_names:
-            default_path = self.defaults_dir / f"{prompt_name}.md"
-            if default_path.exists():
-                base_prompt = default_path.read_text()
+            default_prompt = _read_default_prompt(self.defaults_dir, prompt_name)
+            if default_prompt is not None:
+                base_prompt = default_prompt
                 break
 
         # Check for project prompts (also supports backend-specific)
@@ -122,6 +122,12 @@ def get_prompt_options(prompt_type: PromptType) -> list[PromptOption]:
     return PROMPT_OPTIONS.get(prompt_type, DEFAULT_PROMPT_OPTIONS)
 
 
+def _activity_path(activity: str) -> str:
+    """Extract the file path after the first ': ' of a tool activity line."""
+    _, sep, path = activity.partition(": ")
+    return path.strip() if sep else activity
+
+
 class StageUI:
     """Interface for stage execution UI updates."""
 
@@ -156,10 +162,10 @@ class TUIAdapter(StageUI):
         # Track file operations (only for verbose items)
         if verbose_only:
             if "Read:" in activity or "📖" in activity:
-                path = activity.split(":")[-1].strip() if ":" in activity else activity
+                path = _activity_path(activity)
                 self.app.add_file("read", path)
             elif "Edit:" in activity or "Write:" in activity or "✏️" in activity:
-                path = activity.split(":")[-1].strip() if ":" in activity else activity
+                path = _activity_path(activity)
                 self.app.add_file("write", path)
 
     def add_raw_line(self, line: str) -> None:
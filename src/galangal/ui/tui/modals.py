@@ -61,7 +61,8 @@ class PromptModal(ModalScreen[str]):
         max_key = max((int(o.key) for o in self._options if o.key.isdigit()), default=3)
         hint = f"Press 1-{max_key} to choose, Esc to cancel"
         with Vertical(id="prompt-dialog"):
-            yield Static(self._message, id="prompt-message")
+            # Messages embed raw tool output (errors, reports): render as plain text
+            yield Static(self._message, markup=False, id="prompt-message")
             yield Static(Text.from_markup(options_text), id="prompt-options")
             yield Static(hint, id="prompt-hint")
 
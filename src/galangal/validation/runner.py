@@ -3,6 +3,7 @@ Config-driven validation runner.
 """
 
 import fnmatch
+import re
 import subprocess
 from dataclasses import dataclass
 from typing import Any
@@ -162,11 +163,20 @@ class ValidationRunner:
     - `artifacts_required`: List of artifacts that must exist
 
     If no config exists for a stage, default validation logic is used.
+
+    The set of changed files used by `skip_if` conditions is collected from git
+    once per runner and reused; call `invalidate_changed_files()` after the
+    working tree may have changed.
     """
 
     def __init__(self) -> None:
         self.config = get_config()
         self.project_root = get_project_root()
+        self._changed_files: set[str] | None = None
+
+    def invalidate_changed_files(self) -> None:
+        """Drop the cached changed-file set so the next skip check re-runs git."""
+        self._changed_files = None
 
     def validate_stage(
         self,
@@ -298,52 +308,61 @@ class ValidationRunner:
 
         Returns:
             Set of file paths that have been changed, staged, or are untracked.
-            Empty set on error.
+            Empty set on error. The result is cached on the runner.
         """
+        if self._changed_files is not None:
+            return self._changed_files
+
         changed: set[str] = set()
 
+        base_branch = self.config.pr.base_branch
         try:
-            # 1. Committed changes vs base branch
-            base_branch = self.config.pr.base_branch
-            result = subprocess.run(
-                ["git", "diff", "--name-only", f"{base_branch}...HEAD"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                changed.update(f for f in result.stdout.strip().split("\n") if f)
-
-            # 2. Working tree changes (staged, unstaged, untracked)
-            # Porcelain format: "XY filename" or "XY old -> new" for renames
-            # X = staging area status, Y = working tree status
-            # ?? = untracked, M = modified, A = added, D = deleted, R = renamed
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                for line in result.stdout.strip().split("\n"):
-                    if line and len(line) >= 3:
-                        # Extract filename (handle renames: "R  old -> new")
-                        file_part = line[3:]
-                        if " -> " in file_part:
-                            # For renames, include both old and new paths
-                            old, new = file_part.split(" -> ", 1)
-                            changed.add(old)
-                            changed.add(new)
-                        else:
-                            changed.add(file_part)
-
+            diff_output = self._git_output("diff", "--name-only", f"{base_branch}...HEAD")
         except Exception:
-            pass  # Return whatever we collected so far
-
+            diff_output = ""
+        try:
+            status_output = self._git_output("status", "--porcelain")
+        except Exception:
+            status_output = ""
+
+        # 1. Committed changes vs base branch
+        changed.update(f for f in diff_output.split("\n") if f)
+
+        # 2. Working tree changes (staged, unstaged, untracked)
+        # Porcelain format: "XY filename" or "XY old -> new" for renames
+        # X = staging area status, Y = working tree status
+        # ?? = untracked, M = modified, A = added, D = deleted, R = renamed
+        for line in status_output.split("\n"):
+            if line and len(line) >= 3:
+                # Extract filename (handle renames: "R  old -> new")
+                file_part = line[3:]
+                if " -> " in file_part:
+                    # For renames, include both old and new paths
+                    old, new = file_part.split(" -> ", 1)
+                    changed.add(old)
+                    changed.add(new)
+                else:
+                    changed.add(file_part)
+
+        self._changed_files = changed
         return changed
 
+    def _git_output(self, *args: str) -> str:
+        """Run a git command in the project root and return its stripped stdout.
+
+        Returns an empty string if the command exits non-zero.
+        """
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if result.returncode != 0:
+            return ""
+        return result.stdout.strip()
+
     def _should_skip(self, skip_condition: SkipCondition, task_name: str) -> bool:
         """
         Check if a stage's skip condition is met.
@@ -378,14 +397,14 @@ class ValidationRunner:
                 if isinstance(patterns, str):
                     patterns = [patterns]
 
-                for f in changed_files:
-                    for pattern in patterns:
-                        if fnmatch.fnmatch(f, pattern) or fnmatch.fnmatch(
-                            f.lower(), pattern.lower()
-                        ):
-                            return False  # Found a match, don't skip
-
-                return True  # No matches, skip
+                # One case-insensitive matcher for all patterns instead of two
+                # fnmatch calls per (file, pattern) pair
+                matcher = re.compile(
+                    "|".join(fnmatch.translate(pattern) for pattern in patterns),
+                    re.IGNORECASE,
+                )
+                # Skip only if no changed file matches
+                return not any(matcher.match(f) for f in changed_files)
             except Exception:
                 return False  # On error, don't skip
 
@@ -541,8 +560,7 @@ class ValidationRunner:
 
     def _filter_task_files(self, git_status: str, task_name: str) -> str:
         """Filter out task-related files from git status output."""
-        config = get_config()
-        tasks_dir = config.tasks_dir
+        tasks_dir = self.config.tasks_dir
 
         filtered_lines = []
         for line in git_status.split("\n"):
@@ -564,11 +582,10 @@ class ValidationRunner:
             - {project_root}: Full path to project root
             - {base_branch}: Configured base branch name
         """
-        config = get_config()
         return {
-            "{task_dir}": str(self.project_root / config.tasks_dir / task_name),
+            "{task_dir}": str(self.project_root / self.config.tasks_dir / task_name),
             "{project_root}": str(self.project_root),
-            "{base_branch}": config.pr.base_branch,
+            "{base_branch}": self.config.pr.base_branch,
         }
 
     def _substitute_placeholders(self, text: str, placeholders: dict[str, str]) -> str:
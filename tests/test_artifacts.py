@@ -0,0 +1,39 @@
+"""Tests for artifact helpers."""
+
+from unittest.mock import patch
+
+from galangal.core.artifacts import ArtifactIndex
+
+
+class TestArtifactIndex:
+    """Tests for the ArtifactIndex directory snapshot."""
+
+    def test_scans_task_directory(self, tmp_path):
+        """Test that files present at construction are reported."""
+        (tmp_path / "SPEC.md").write_text("spec")
+        (tmp_path / "MIGRATION_SKIP.md").write_text("skip")
+
+        with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path):
+            index = ArtifactIndex("test-task")
+
+        assert "SPEC.md" in index
+        assert "MIGRATION_SKIP.md" in index
+        assert "PLAN.md" not in index
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Test that a missing task directory yields an empty snapshot."""
+        with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path / "missing"):
+            index = ArtifactIndex("test-task")
+
+        assert "SPEC.md" not in index
+
+    def test_refresh_picks_up_new_files(self, tmp_path):
+        """Test that the snapshot only changes after refresh()."""
+        with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path):
+            index = ArtifactIndex("test-task")
+            (tmp_path / "SPEC.md").write_text("spec")
+            assert "SPEC.md" not in index
+
+            index.refresh()
+
+        assert "SPEC.md" in index
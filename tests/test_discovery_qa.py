@@ -577,6 +577,47 @@ class TestPromptBuilderDiscovery:
 
         assert "first round" in prompt.lower() or "None" in prompt
 
+    def test_project_prompt_edits_seen_between_calls(self, tmp_path, monkeypatch):
+        """Test that project prompts are re-read while defaults are cached."""
+        from galangal.prompts.builder import PromptBuilder, _read_default_prompt
+
+        _read_default_prompt.cache_clear()
+
+        galangal_dir = tmp_path / ".galangal"
+        galangal_dir.mkdir()
+        (galangal_dir / "config.yaml").write_text("project:\n  name: Test")
+        prompts_dir = galangal_dir / "prompts"
+        prompts_dir.mkdir()
+
+        monkeypatch.chdir(tmp_path)
+
+        builder = PromptBuilder()
+        default_prompt = builder.get_prompt_by_name("pm_questions")
+
+        (prompts_dir / "pm_questions.md").write_text("# Ours\n\n# BASE")
+        merged = PromptBuilder().get_prompt_by_name("pm_questions")
+
+        assert merged == f"# Ours\n\n{default_prompt}"
+        assert _read_default_prompt.cache_info().hits > 0
+
+    def test_defaults_dir_is_honored(self, tmp_path, monkeypatch):
+        """Test that defaults are read from the builder's defaults_dir."""
+        from galangal.prompts.builder import PromptBuilder
+
+        galangal_dir = tmp_path / ".galangal"
+        galangal_dir.mkdir()
+        (galangal_dir / "config.yaml").write_text("project:\n  name: Test")
+        defaults_dir = tmp_path / "defaults"
+        defaults_dir.mkdir()
+        (defaults_dir / "pm_questions.md").write_text("Custom default")
+
+        monkeypatch.chdir(tmp_path)
+
+        builder = PromptBuilder()
+        builder.defaults_dir = defaults_dir
+
+        assert builder.get_prompt_by_name("pm_questions") == "Custom default"
+
 
 # -----------------------------------------------------------------------------
 # Config Tests
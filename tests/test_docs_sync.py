@@ -11,8 +11,11 @@ from pathlib import Path
 import pytest
 
 from galangal.core.state import (
+    STAGE_BY_NAME,
+    STAGE_INDEX,
     STAGE_METADATA,
     STAGE_ORDER,
+    Stage,
     TaskType,
     get_task_type_pipeline,
 )
@@ -160,6 +163,21 @@ class TestStageMetadataConsistency:
             f"  In METADATA only: {metadata_set - order_set}"
         )
 
+    def test_stage_index_matches_order(self):
+        """STAGE_INDEX should give each stage's position in STAGE_ORDER."""
+        assert STAGE_INDEX == {stage: STAGE_ORDER.index(stage) for stage in STAGE_ORDER}
+
+    def test_stage_by_name_covers_every_stage(self):
+        """STAGE_BY_NAME should map each stage's value back to the stage."""
+        assert all(STAGE_BY_NAME[stage.value] is stage for stage in Stage)
+        assert len(STAGE_BY_NAME) == len(Stage)
+
+    def test_stage_from_str_uses_stage_by_name(self):
+        """Stage.from_str should be case-insensitive and reject unknown names."""
+        assert Stage.from_str("qa") is Stage.QA
+        with pytest.raises(ValueError):
+            Stage.from_str("NOT_A_STAGE")
+
     def test_conditional_stages_have_skip_artifacts(self):
         """Conditional stages should have skip artifacts defined."""
         for stage, metadata in STAGE_METADATA.items():
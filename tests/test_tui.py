@@ -2,9 +2,11 @@
 Tests for the TUI components using Textual's pilot framework.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from galangal.ui.tui import PromptType, WorkflowTUIApp
+from galangal.ui.tui import PromptType, TUIAdapter, WorkflowTUIApp
 
 
 @pytest.fixture
@@ -148,6 +150,20 @@ class TestPromptActions:
 
             assert callback_result == ["no"]
 
+    @pytest.mark.asyncio
+    async def test_prompt_modal_message_is_not_markup(self, app):
+        """Test that bracketed text in a prompt message is shown literally."""
+        from textual.widgets import Static
+
+        message = "Error: closing tag [/bold] in list[int]\n[... truncated]"
+        async with app.run_test() as pilot:
+            app.show_prompt(PromptType.PLAN_APPROVAL, message, lambda v: None)
+
+            await pilot.pause()
+
+            rendered = app.screen.query_one("#prompt-message", Static).render()
+            assert str(rendered) == message
+
     @pytest.mark.asyncio
     async def test_prompt_modal_escape_quits(self, app):
         """Test that pressing Escape triggers quit callback."""
@@ -175,3 +191,22 @@ class TestPromptActions:
             # When input is active, check_action should return False
             app._input_callback = lambda v: None
             assert app.check_action_quit_workflow() is False
+
+
+class TestTUIAdapter:
+    """Tests for TUIAdapter file tracking."""
+
+    def test_tracks_file_paths_from_tool_activity(self):
+        """Test that verbose read/write activities record the path after the label."""
+        mock_app = MagicMock()
+        adapter = TUIAdapter(mock_app)
+
+        adapter.add_activity("📖 Read: src/app.py", verbose_only=True)
+        adapter.add_activity("✏️ Edit: C:/tmp/notes.md", verbose_only=True)
+        adapter.add_activity("📖 reading files", verbose_only=True)
+
+        assert [c.args for c in mock_app.add_file.call_args_list] == [
+            ("read", "src/app.py"),
+            ("write", "C:/tmp/notes.md"),
+            ("read", "📖 reading files"),
+        ]
@@ -0,0 +1,103 @@
+"""Tests for helper functions in the TUI workflow runner."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from galangal.config.schema import GalangalConfig
+from galangal.core.state import Stage, WorkflowState, get_conditional_stages
+from galangal.core.workflow.engine import EventType, WorkflowEvent
+from galangal.core.workflow.tui_runner import (
+    _build_preflight_error_message,
+    _get_skip_reasons,
+    _handle_advance_event,
+)
+
+
+class TestBuildPreflightErrorMessage:
+    """Tests for _build_preflight_error_message."""
+
+    def test_collects_failed_lines(self):
+        """Test that only failure lines are included in the modal message."""
+        details = "✓ Git clean\n  ✗ Docker not running\nMissing .env file\nAll else ok"
+
+        message = _build_preflight_error_message("Preflight failed", details)
+
+        assert "✗ Docker not running" in message
+        assert "Missing .env file" in message
+        assert "Git clean" not in message
+        assert "All else ok" not in message
+        assert message.endswith("Fix issues and retry?")
+
+    def test_limits_to_ten_failed_lines(self):
+        """Test that at most ten failure lines are shown."""
+        details = "\n".join(f"Error {i}" for i in range(25))
+
+        message = _build_preflight_error_message("Preflight failed", details)
+
+        assert "Error 9" in message
+        assert "Error 10" not in message
+
+    def test_falls_back_to_raw_details(self):
+        """Test that raw details are shown when no failure lines match."""
+        details = "x" * 800
+
+        message = _build_preflight_error_message("Preflight failed", details)
+
+        assert "x" * 500 in message
+        assert "x" * 501 not in message
+
+
+class TestGetSkipReasons:
+    """Tests for _get_skip_reasons."""
+
+    def test_reuses_provided_runner(self):
+        """Test that a provided runner is used for skip_if checks."""
+        state = WorkflowState.new("Test task", "test-task")
+        runner = MagicMock()
+        runner.should_skip_stage.return_value = True
+
+        with patch("galangal.core.workflow.tui_runner.ValidationRunner") as runner_cls:
+            reasons = _get_skip_reasons(state, GalangalConfig(), runner)
+
+        runner_cls.assert_not_called()
+        assert runner.should_skip_stage.called
+        assert all(stage.value in reasons for stage in get_conditional_stages())
+
+
+class TestHandleAdvanceEvent:
+    """Tests for skipped-stage reporting in _handle_advance_event."""
+
+    def _engine(self):
+        engine = MagicMock()
+        engine.state = WorkflowState.new("Test", "test-task")
+        engine.state.stage = Stage.TEST
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_reports_skipped_stages_in_one_message(self):
+        """Test that several skipped stages are reported in a single message."""
+        app = MagicMock()
+        event = WorkflowEvent(
+            EventType.STAGE_STARTED,
+            stage=Stage.TEST,
+            data={"skipped_stages": [Stage.MIGRATION, Stage.CONTRACT]},
+        )
+
+        result = await _handle_advance_event(app, self._engine(), event, GalangalConfig())
+
+        assert result == "continue"
+        app.show_message.assert_called_once_with(
+            "Skipped MIGRATION, CONTRACT (condition not met)", "info"
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_message_when_nothing_skipped(self):
+        """Test that no skip message is shown when no stages were skipped."""
+        app = MagicMock()
+        event = WorkflowEvent(EventType.STAGE_STARTED, stage=Stage.TEST)
+
+        result = await _handle_advance_event(app, self._engine(), event, GalangalConfig())
+
+        assert result == "continue"
+        app.show_message.assert_not_called()
@@ -453,6 +453,22 @@ class TestValidationRunnerSkipConditions:
                     should_skip = runner._should_skip(skip_condition, "test-task")
                     assert should_skip is True
 
+    def test_patterns_match_case_insensitively(self):
+        """Test that skip patterns match changed files regardless of case."""
+        with patch("galangal.validation.runner.get_config", return_value=self.config):
+            with patch("galangal.validation.runner.get_project_root", return_value=Path("/tmp")):
+                runner = ValidationRunner()
+
+                skip_condition = SkipCondition(no_files_match=["*.sql", "migrations/*"])
+
+                mock_result = MagicMock()
+                mock_result.stdout = "db/Migrations/001.SQL"
+                mock_result.returncode = 0
+
+                with patch("galangal.validation.runner.subprocess.run", return_value=mock_result):
+                    should_skip = runner._should_skip(skip_condition, "test-task")
+                    assert should_skip is False
+
     def test_no_skip_when_git_fails(self):
         """Test no skip when git diff returns non-zero exit code."""
         with patch("galangal.validation.runner.get_config", return_value=self.config):
@@ -469,6 +485,27 @@ class TestValidationRunnerSkipConditions:
                     should_skip = runner._should_skip(skip_condition, "test-task")
                     assert should_skip is False  # On git error, don't skip
 
+    def test_changed_files_collected_once_per_runner(self):
+        """Test that repeated skip checks reuse the changed-file set from git."""
+        with patch("galangal.validation.runner.get_config", return_value=self.config):
+            with patch("galangal.validation.runner.get_project_root", return_value=Path("/tmp")):
+                runner = ValidationRunner()
+
+                mock_result = MagicMock()
+                mock_result.stdout = "src/main.py"
+                mock_result.returncode = 0
+
+                with patch(
+                    "galangal.validation.runner.subprocess.run", return_value=mock_result
+                ) as mock_run:
+                    runner._should_skip(SkipCondition(no_files_match="*.sql"), "test-task")
+                    runner._should_skip(SkipCondition(no_files_match="*.proto"), "test-task")
+                    assert mock_run.call_count == 2  # git diff + git status, once
+
+                    runner.invalidate_changed_files()
+                    runner._should_skip(SkipCondition(no_files_match="*.sql"), "test-task")
+                    assert mock_run.call_count == 4
+
 
 class TestValidationRunnerPreflightChecks:
     """Tests for _run_preflight_checks method."""
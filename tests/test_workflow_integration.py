@@ -139,7 +139,7 @@ class MockAIBackend:
 class TestWorkflowStageProgression:
     """Tests for stage progression through the workflow."""
 
-    def test_full_stage_order_for_feature(self):
+    def test_full_stage_order_for_feature(self, tmp_path):
         """Test that FEATURE task type visits all expected stages."""
         state = make_state(task_type=TaskType.FEATURE)
         config = GalangalConfig()
@@ -148,7 +148,7 @@ class TestWorkflowStageProgression:
         current = Stage.PM
 
         with patch("galangal.core.workflow.core.get_config", return_value=config):
-            with patch("galangal.core.workflow.core.artifact_exists", return_value=False):
+            with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path):
                 mock_runner = MagicMock()
                 mock_runner.should_skip_stage.return_value = False
                 with patch(
@@ -173,7 +173,7 @@ class TestWorkflowStageProgression:
         assert Stage.SUMMARY in visited_stages
         assert Stage.COMPLETE in visited_stages
 
-    def test_docs_task_type_skips_stages(self):
+    def test_docs_task_type_skips_stages(self, tmp_path):
         """Test that DOCS task type skips most stages (PM → DOCS only)."""
         state = make_state(task_type=TaskType.DOCS)
         config = GalangalConfig()
@@ -182,7 +182,7 @@ class TestWorkflowStageProgression:
         current = Stage.PM
 
         with patch("galangal.core.workflow.core.get_config", return_value=config):
-            with patch("galangal.core.workflow.core.artifact_exists", return_value=False):
+            with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path):
                 mock_runner = MagicMock()
                 mock_runner.should_skip_stage.return_value = False
                 with patch(
@@ -211,7 +211,7 @@ class TestWorkflowStageProgression:
         assert Stage.SUMMARY in visited_stages
         assert visited_stages == [Stage.PM, Stage.DOCS, Stage.SUMMARY, Stage.COMPLETE]
 
-    def test_config_skip_stages(self):
+    def test_config_skip_stages(self, tmp_path):
         """Test that config-level skip removes stages from workflow."""
         state = make_state(task_type=TaskType.FEATURE)
         config = GalangalConfig(stages=StageConfig(skip=["BENCHMARK", "SECURITY"]))
@@ -220,7 +220,7 @@ class TestWorkflowStageProgression:
         current = Stage.PM
 
         with patch("galangal.core.workflow.core.get_config", return_value=config):
-            with patch("galangal.core.workflow.core.artifact_exists", return_value=False):
+            with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path):
                 mock_runner = MagicMock()
                 mock_runner.should_skip_stage.return_value = False
                 with patch(
@@ -404,6 +404,19 @@ class TestRollbackIntegration:
         assert "Previous rollback info" in resolved_content
         assert "Resolved" in resolved_content
 
+    def test_archive_rollback_appends_to_resolved_log(self, sample_task: Path):
+        """Test that repeated archives accumulate in ROLLBACK_RESOLVED.md."""
+        mock_ui = MockStageUI()
+        create_artifact(sample_task, "ROLLBACK_RESOLVED.md", "# First rollback\n")
+        create_artifact(sample_task, "ROLLBACK.md", "# Second rollback\n")
+
+        with patch("galangal.core.artifacts.get_task_dir", return_value=sample_task):
+            archive_rollback_if_exists("test-task", mock_ui)
+
+        resolved_content = (sample_task / "ROLLBACK_RESOLVED.md").read_text()
+        assert resolved_content.startswith("# First rollback\n\n---\n# Second rollback")
+        assert not (sample_task / "ROLLBACK.md").exists()
+
 
 class TestRetryBehavior:
     """Tests for retry logic in workflow execution."""
@@ -476,6 +489,17 @@ class TestRetryBehavior:
         assert state.last_failure == small_error
         assert "[... truncated" not in state.last_failure
 
+    def test_set_failure_truncates_without_counting_attempt(self):
+        """Test that set_failure bounds the message but leaves attempt unchanged."""
+        state = make_state(attempt=1)
+
+        state.set_failure("x" * 10000)
+
+        assert state.attempt == 1
+        assert state.last_failure.startswith("x" * 4000)
+        assert "x" * 4001 not in state.last_failure
+        assert "[... truncated, see logs/ for full output]" in state.last_failure
+
     def test_can_retry_check(self):
         """Test can_retry logic."""
         state = make_state(attempt=1)
@@ -510,19 +534,14 @@ class TestRetryBehavior:
 class TestConditionalStageSkipping:
     """Tests for conditional stage skipping logic."""
 
-    def test_migration_skipped_with_skip_artifact(self):
+    def test_migration_skipped_with_skip_artifact(self, sample_task: Path):
         """Test MIGRATION is skipped when MIGRATION_SKIP.md exists."""
         state = make_state(task_type=TaskType.FEATURE, stage=Stage.DEV)
         config = GalangalConfig()
-
-        def artifact_exists_side_effect(name, task):
-            return name == "MIGRATION_SKIP.md"
+        create_artifact(sample_task, "MIGRATION_SKIP.md", "# MIGRATION Stage Skipped\n")
 
         with patch("galangal.core.workflow.core.get_config", return_value=config):
-            with patch(
-                "galangal.core.workflow.core.artifact_exists",
-                side_effect=artifact_exists_side_effect,
-            ):
+            with patch("galangal.core.artifacts.get_task_dir", return_value=sample_task):
                 mock_runner = MagicMock()
                 mock_runner.should_skip_stage.return_value = False
                 with patch(
@@ -534,13 +553,13 @@ class TestConditionalStageSkipping:
         # Should skip MIGRATION and go to TEST
         assert next_stage == Stage.TEST
 
-    def test_migration_skipped_when_no_sql_files(self):
+    def test_migration_skipped_when_no_sql_files(self, tmp_path):
         """Test MIGRATION is skipped when should_skip_stage returns True."""
         state = make_state(task_type=TaskType.FEATURE, stage=Stage.DEV)
         config = GalangalConfig()
 
         with patch("galangal.core.workflow.core.get_config", return_value=config):
-            with patch("galangal.core.workflow.core.artifact_exists", return_value=False):
+            with patch("galangal.core.artifacts.get_task_dir", return_value=tmp_path):
                 mock_runner = MagicMock()
                 # should_skip_stage returns True (no matching files)
                 mock_runner.should_skip_stage.return_value = True
@@ -591,6 +610,33 @@ class TestStatePersistence:
         assert loaded_state.rollback_history[0].from_stage == "QA"
         assert loaded_state.rollback_history[0].to_stage == "DEV"
 
+    def test_save_state_skips_unchanged_write(self, sample_task: Path):
+        """Test that saving identical state does not rewrite state.json."""
+        state = make_state(task_name="test-task", stage=Stage.DEV)
+
+        with patch("galangal.core.state.get_task_dir", return_value=sample_task):
+            save_state(state)
+            with patch.object(Path, "write_text") as mock_write:
+                save_state(state)
+                mock_write.assert_not_called()
+
+                # A changed state is written
+                state.attempt = 2
+                save_state(state)
+                mock_write.assert_called_once()
+
+    def test_save_state_rewrites_externally_modified_file(self, sample_task: Path):
+        """Test that an externally modified state.json is overwritten."""
+        state = make_state(task_name="test-task", stage=Stage.DEV)
+        state_file = sample_task / "state.json"
+
+        with patch("galangal.core.state.get_task_dir", return_value=sample_task):
+            save_state(state)
+            state_file.write_text("{}")
+            save_state(state)
+
+        assert json.loads(state_file.read_text())["stage"] == "DEV"
+
     def test_state_from_dict_with_defaults(self):
         """Test loading state with missing optional fields uses defaults."""
         minimal_data = {